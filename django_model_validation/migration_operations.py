@@ -1,6 +1,7 @@
+from django.db import router
 from django.db.migrations import RunPython
 
-from django_model_validation.validators import ModelValidator
+from django_model_validation.validators import ModelValidator, update_caches
 
 
 class UpdateModelValidatorCache(RunPython):
@@ -25,13 +26,14 @@ class UpdateModelValidatorCache(RunPython):
         self.model_name = model_name
         self.validators = validators
 
-        # Instead of passing the migration functions below, we pass a placeholder for now.
+        # The migration function below is called directly, so `code` is only a placeholder.
         super().__init__(RunPython.noop)
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state):
-        # Monkey patch the `code` function with a lambda that passes an extra argument `app_label`
-        self.code = lambda apps, se: self.migrate(apps, se, app_label)
-        super().database_forwards(app_label, schema_editor, from_state, to_state)
+        # Mirrors `RunPython.database_forwards`, but passes the extra argument `app_label` to the migration function
+        from_state.clear_delayed_apps_cache()
+        if router.allow_migrate(schema_editor.connection.alias, app_label, **self.hints):
+            self.migrate(from_state.apps, schema_editor, app_label)
 
     def database_backwards(self, app_label, schema_editor, from_state, to_state):
         pass
@@ -41,5 +43,4 @@ class UpdateModelValidatorCache(RunPython):
         db_alias = schema_editor.connection.alias
         qs = model.objects.using(db_alias).all()
 
-        for validator in self.validators:
-            validator.update_cache(qs)
+        update_caches(qs, self.validators)
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any, Callable, Iterable, Iterator, Optional, Type, Union
 
 from django.core.exceptions import ValidationError
@@ -7,7 +8,7 @@ from django.db.models.base import ModelBase
 
 from django_model_validation.required_fields import ensure_values_exist
 from django_model_validation.utils import collect_validation_errors
-from django_model_validation.validators import ModelValidator
+from django_model_validation.validators import VALIDATOR_MEMO_ATTRIBUTE, ModelValidator, update_caches
 
 
 def validator(
@@ -19,6 +20,10 @@ def validator(
         auto_update_cache: bool = True,
         property_name: Optional[str] = None,
         property_verbose_name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        select_related: Iterable[str] = (),
+        prefetch_related: Iterable[str] = (),
+        memoize: bool = False,
 ):
     """
     Decorator that enhances a method of a Django model that performs any custom validation of the data.
@@ -41,6 +46,7 @@ def validator(
     - validate(): Runs the validation and raises an `ValidationError` if the validation fails. This is the same as
       calling the validator method directly.
     - update_cache(): Runs the validation and stores the result in the cache field.
+    - update_cache_and_save(): Runs the validation, stores the result in the cache field and saves only this field.
     - clear_cache(): Clears the validation result from the cache field.
     - is_cached(): Returns `True` if the cache field contains a validation result and `False` otherwise.
     - get_cache(): Returns the boolean validation result if the cache is present and `None` otherwise.
@@ -76,6 +82,18 @@ def validator(
              as a proxy to the is_valid() method of this validator.
         property_verbose_name (str, optional): If set, this will be used as `verbose_name` for the cache field as well
             as for generic error messages.
+        fields (iterable of str, optional): Names of all fields of the model itself accessed by the validator. If set
+            for all validators whose caches are updated at once, only these fields are loaded from the database when
+            updating caches of many objects. Fields of related models are not restricted; relations are declared using
+            `select_related` and `prefetch_related` instead.
+        select_related (iterable of str, optional): Foreign key and one-to-one relations accessed by the validator.
+            These are joined using `select_related()` when updating caches of many objects.
+        prefetch_related (iterable of str, optional): Many-to-many and reverse foreign key relations accessed by the
+            validator. These are fetched using a single extra query per batch when updating caches of many objects.
+        memoize (bool): If True, the validation result is stored on the model instance and reused by subsequent
+            validations of the same instance until it is saved or refreshed from the database. Modifications of the
+            instance in the meantime are not taken into account.
+            *Defaults to False.*
 
     Example::
 
@@ -98,6 +116,10 @@ def validator(
             auto_update_cache,
             property_name,
             property_verbose_name,
+            None if fields is None else tuple(fields),
+            tuple(select_related),
+            tuple(prefetch_related),
+            memoize,
         )
 
     if function is None:
@@ -111,7 +133,27 @@ class ModelBaseWithValidators(ModelBase):
     def __new__(cls, name, bases, attrs, **kwargs):
         new_class = super().__new__(cls, name, bases, attrs, **kwargs)
 
-        new_class._model_validators = []
+        # Collect inherited validators, letting attributes of classes later in the MRO override earlier ones
+        inherited_validators = {}
+        for klass in reversed(new_class.__mro__[1:]):
+            for attribute_name, attribute_value in vars(klass).items():
+                if isinstance(attribute_value, ModelValidator):
+                    inherited_validators[attribute_name] = attribute_value
+                else:
+                    inherited_validators.pop(attribute_name, None)
+
+        for attribute_name in attrs:
+            inherited_validators.pop(attribute_name, None)
+
+        new_class._model_validators = ()
+        new_class._group_validators()
+
+        for attribute_name, model_validator in inherited_validators.items():
+            # Each class gets its own copy of an inherited validator, such that class-level helpers operate on it
+            model_validator = replace(model_validator)
+            model_validator.model_type = new_class
+            setattr(new_class, attribute_name, model_validator)
+            new_class._register_validator(model_validator)
 
         for attribute_value in attrs.values():
             if isinstance(attribute_value, ModelValidator):
@@ -130,9 +172,9 @@ class ValidatingModelManager(Manager):
     def get_queryset(self):
         qs = super().get_queryset()
         if self.exclude_valid:
-            qs = qs.exclude(self.model.get_custom_validity_condition())
+            qs = qs.exclude(self.model._custom_validity_condition)
         if self.exclude_invalid:
-            qs = qs.exclude(~self.model.get_custom_validity_condition())
+            qs = qs.exclude(self.model._custom_invalidity_condition)
         return qs
 
     def __set_name__(self, model_type: Type['ValidatingModel']):
@@ -153,8 +195,46 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
 
     @classmethod
     def _register_validator(cls, model_validator: ModelValidator) -> None:
-        cls._model_validators.append(model_validator)
+        cls._model_validators = (*cls._model_validators, model_validator)
         model_validator._register_for_model()
+        cls._group_validators()
+
+    @classmethod
+    def _group_validators(cls) -> None:
+        cls._auto_model_validators = tuple(
+            model_validator for model_validator in cls._model_validators if model_validator.auto
+        )
+        cls._cached_model_validators = tuple(
+            model_validator for model_validator in cls._model_validators if model_validator.cache
+        )
+        cls._uncached_model_validators = tuple(
+            model_validator for model_validator in cls._model_validators if not model_validator.cache
+        )
+        cls._auto_cached_model_validators = tuple(
+            model_validator for model_validator in cls._cached_model_validators if model_validator.auto
+        )
+        cls._auto_uncached_model_validators = tuple(
+            model_validator for model_validator in cls._uncached_model_validators if model_validator.auto
+        )
+        cls._auto_updated_cached_model_validators = tuple(
+            model_validator for model_validator in cls._cached_model_validators if model_validator.auto_update_cache
+        )
+
+        # Keyword arguments for `QuerySet.update` that clear the respective caches
+        cls._cleared_cache_values = {
+            model_validator._property_name: None for model_validator in cls._cached_model_validators
+        }
+        cls._cleared_auto_updated_cache_values = {
+            model_validator._property_name: None for model_validator in cls._auto_updated_cached_model_validators
+        }
+
+        # Conditions combining all cached validators. `Q` objects are never mutated when used, so they can be shared.
+        cls._are_validation_results_cached_condition = ~Q(pk__in=[])
+        cls._custom_validity_condition = ~Q(pk__in=[])
+        for model_validator in cls._cached_model_validators:
+            cls._are_validation_results_cached_condition &= model_validator.get_is_cached_condition()
+            cls._custom_validity_condition &= model_validator.get_is_valid_condition()
+        cls._custom_invalidity_condition = ~cls._custom_validity_condition
 
     def get_custom_validator_errors(self, *, use_all: bool = False) -> Iterator[ValidationError]:
         """
@@ -165,12 +245,12 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
                 with the `auto` option set are executed.
                 *Defaults to False.*
         """
-        for model_validator in self._model_validators:
-            if use_all is True or model_validator.auto:
-                try:
-                    model_validator.get_instance_validator(self).validate()
-                except ValidationError as err:
-                    yield err
+        model_validators = self._model_validators if use_all is True else self._auto_model_validators
+
+        for model_validator in model_validators:
+            validation_error = model_validator.get_instance_validator(self).get_validation_error()
+            if validation_error is not None:
+                yield validation_error
 
     def run_custom_validators(self, *, use_all: bool = False) -> None:
         """
@@ -208,12 +288,26 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
         Returns:
             bool: `True` if all validations succeed, `False` otherwise.
         """
-        for model_validator in self._model_validators:
-            if use_all is True or model_validator.auto:
-                if not model_validator.get_instance_validator(self).is_valid(use_cache=use_caches):
-                    return False
+        if use_all is True:
+            cached_model_validators = self._cached_model_validators
+            uncached_model_validators = self._uncached_model_validators
+        else:
+            cached_model_validators = self._auto_cached_model_validators
+            uncached_model_validators = self._auto_uncached_model_validators
+
+        # Cached results are read directly from the instance first, as they are cheap and may make running the
+        # remaining validators unnecessary
+        for model_validator in cached_model_validators:
+            use_cache = model_validator.auto_use_cache if use_caches is None else use_caches
+            is_valid = getattr(self, model_validator._property_name) if use_cache else None
+
+            if is_valid is None:
+                is_valid = model_validator.get_instance_validator(self).get_validation_error() is None
+
+            if not is_valid:
+                return False
 
-        return True
+        return all(model_validator._get_validation_error(self) is None for model_validator in uncached_model_validators)
 
     def get_custom_validator_results(
             self,
@@ -235,11 +329,11 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
         Returns:
             dict: A dictionary mapping the validator property names to their boolean validation results.
         """
+        model_validators = self._model_validators if use_all is True else self._auto_model_validators
+
         return {
-            model_validator.get_property_name(): model_validator.get_instance_validator(self).is_valid(
-                use_cache=use_caches)
-            for model_validator in self._model_validators
-            if use_all is True or model_validator.auto
+            model_validator._property_name: model_validator.get_instance_validator(self).is_valid(use_cache=use_caches)
+            for model_validator in model_validators
         }
 
     def is_valid(
@@ -278,7 +372,6 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
             use_caches=use_validator_caches,
         )
 
-    @collect_validation_errors
     def full_clean(self, *args, use_custom_validators: Optional[bool] = None, **kwargs):
         """
         Runs the default `full_clean` method as well as the custom validators and combines potential validation errors
@@ -296,15 +389,28 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
             ValidationError: If the default `full_clean` method or any of the custom validators raise a
                 `ValidationError`.
         """
+        if use_custom_validators is not False:
+            model_validators = self._model_validators if use_custom_validators is True else self._auto_model_validators
+        else:
+            model_validators = ()
+
+        # Without any custom validators to run, there are no errors to combine
+        if not model_validators:
+            super().full_clean(*args, **kwargs)
+            return
+
+        self._collect_full_clean_errors(*args, use_all=use_custom_validators is True, **kwargs)
+
+    @collect_validation_errors
+    def _collect_full_clean_errors(self, *args, use_all: bool, **kwargs) -> Iterator[ValidationError]:
         try:
             super().full_clean(*args, **kwargs)
         except ValidationError as err:
             yield err
 
-        if use_custom_validators is not False:
-            yield from self.get_custom_validator_errors(use_all=use_custom_validators is True)
+        yield from self.get_custom_validator_errors(use_all=use_all)
 
-    def update_validator_caches(self, *, update_all: bool = False):
+    def update_validator_caches(self, *, update_all: bool = False, save: bool = False):
         """
         Runs all validators with caches on this modal instance and updates the cached results accordingly.
 
@@ -312,10 +418,32 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
             update_all (bool, optional): If `True`, all custom validators with caches are update. If `False`, only
                 custom validators with cashes with the `auto_update_cache` option set are executed.
                 *Defaults to False.*
+            save (bool, optional): If `True`, all cache fields whose values changed are saved to the database using a
+                single query that does not touch any other field. If the instance has not been saved to the database
+                yet, it is saved entirely instead.
+                *Defaults to False.*
         """
-        for model_validator in self._model_validators:
-            if model_validator.cache and (update_all is True or model_validator.auto_update_cache):
+        model_validators = (
+            self._cached_model_validators if update_all is True else self._auto_updated_cached_model_validators
+        )
+
+        if not save:
+            for model_validator in model_validators:
                 model_validator.get_instance_validator(self).update_cache()
+            return
+
+        changed_fields = []
+        for model_validator in model_validators:
+            previous_value = getattr(self, model_validator._property_name)
+            model_validator.get_instance_validator(self).update_cache()
+            if getattr(self, model_validator._property_name) != previous_value:
+                changed_fields.append(model_validator._property_name)
+
+        if self._state.adding:
+            # Fields can only be saved selectively for objects that already exist in the database
+            self.save(update_validator_caches=False)
+        elif changed_fields:
+            self.save(update_fields=changed_fields, update_validator_caches=False)
 
     def clear_validator_caches(self, *, clear_all: bool = False):
         """
@@ -326,9 +454,12 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
                 custom validators with cashes with the `auto_update_cache` option set are cleared.
                 *Defaults to False.*
         """
-        for model_validator in self._model_validators:
-            if model_validator.cache and (clear_all is True or model_validator.auto_update_cache):
-                model_validator.get_instance_validator(self).clear_cache()
+        model_validators = (
+            self._cached_model_validators if clear_all is True else self._auto_updated_cached_model_validators
+        )
+
+        for model_validator in model_validators:
+            model_validator.get_instance_validator(self).clear_cache()
 
     def are_validation_results_cached(self):
         """
@@ -336,8 +467,7 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
         """
         return all(
             model_validator.get_instance_validator(self).is_cached()
-            for model_validator in self._model_validators
-            if model_validator.cache
+            for model_validator in self._cached_model_validators
         )
 
     def save(self, *args, update_validator_caches: Optional[bool] = None, **kwargs):
@@ -353,11 +483,26 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
                 caches at all.
                 *Defaults to None.*
         """
+        self.clear_validator_memo()
+
         if update_validator_caches is not False:
             self.update_validator_caches(update_all=update_validator_caches is True)
 
         super().save(*args, **kwargs)
 
+    def refresh_from_db(self, *args, **kwargs):
+        """
+        Discards memoized validation results before running the default `refresh_from_db` method.
+        """
+        self.clear_validator_memo()
+        super().refresh_from_db(*args, **kwargs)
+
+    def clear_validator_memo(self):
+        """
+        Discards all validation results memoized by validators with the `memoize` option.
+        """
+        self.__dict__.pop(VALIDATOR_MEMO_ATTRIBUTE, None)
+
     @classmethod
     def update_validator_caches_globally(cls, queryset: Optional[QuerySet] = None, *, update_all: bool = False):
         """
@@ -371,12 +516,26 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
                 custom validators with cashes with the `auto_update_cache` option set are executed.
                 *Defaults to False.*
         """
-        for model_validator in cls._model_validators:
-            if model_validator.cache and (update_all is True or model_validator.auto_update_cache):
-                model_validator.update_cache(queryset)
+        cls._refresh_validator_caches(
+            queryset,
+            cls._cached_model_validators if update_all is True else cls._auto_updated_cached_model_validators,
+        )
+
+    @classmethod
+    def _refresh_validator_caches(cls, queryset: Optional[QuerySet], model_validators: Iterable[ModelValidator]):
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        update_caches(queryset, model_validators)
 
     @classmethod
-    def clear_validator_caches_globally(cls, queryset: Optional[QuerySet] = None, *, clear_all: bool = False):
+    def clear_validator_caches_globally(
+            cls,
+            queryset: Optional[QuerySet] = None,
+            *,
+            clear_all: bool = False,
+            chunk_size: Optional[int] = None,
+    ):
         """
         Clears all cached validation results of all objects in the database (or a subset thereof).
 
@@ -386,30 +545,41 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
             clear_all (bool, optional): If `True`, all custom validators with caches are cleared. If `False`, only
                 custom validators with cashes with the `auto_update_cache` option set are cleared.
                 *Defaults to False.*
+            chunk_size (int, optional): If provided, the objects are updated in chunks of this size (ordered by
+                primary key) instead of using a single query. This avoids locking large tables for a long time.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
         """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError('Chunk size must be strictly positive.')
+
         if queryset is None:
             queryset = cls.objects.all()
 
-        fields = [
-            model_validator.get_property_name()
-            for model_validator in cls._model_validators
-            if model_validator.cache and (clear_all is True or model_validator.auto_update_cache)
-        ]
+        values = cls._cleared_cache_values if clear_all is True else cls._cleared_auto_updated_cache_values
 
-        queryset.update(**{field: None for field in fields})
+        if not values:
+            return
+
+        if chunk_size is None:
+            queryset.update(**values)
+            return
+
+        manager = cls._base_manager.db_manager(queryset.db)
+        pk_queryset = queryset.order_by('pk').values_list('pk', flat=True)
+        pks = list(pk_queryset[:chunk_size])
+
+        while pks:
+            manager.filter(pk__in=pks).update(**values)
+            pks = list(pk_queryset.filter(pk__gt=pks[-1])[:chunk_size])
 
     @classmethod
     def get_are_validation_results_cached_condition(cls) -> Q:
         """
         Returns a `Q` object for checking if all validation caches are non-empty.
         """
-        condition = ~Q(pk__in=[])
-
-        for model_validator in cls._model_validators:
-            if model_validator.cache:
-                condition &= model_validator.get_is_cached_condition()
-
-        return condition
+        return cls._are_validation_results_cached_condition
 
     @classmethod
     def are_validation_results_cached_globally(cls, queryset: Optional[QuerySet] = None) -> bool:
@@ -419,20 +589,14 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
         if queryset is None:
             queryset = cls.objects.all()
 
-        return queryset.filter(cls.get_are_validation_results_cached_condition()).exists()
+        return not queryset.exclude(cls.get_are_validation_results_cached_condition()).exists()
 
     @classmethod
     def get_custom_validity_condition(cls) -> Q:
         """
         Returns a `Q` object for checking if all custom validators with caches succeed according to cached results.
         """
-        condition = ~Q(pk__in=[])
-
-        for model_validator in cls._model_validators:
-            if model_validator.cache:
-                condition &= model_validator.get_is_valid_condition()
-
-        return condition
+        return cls._custom_validity_condition
 
     @classmethod
     def check_custom_validators_globally(cls, queryset: Optional[QuerySet] = None) -> bool:
@@ -442,7 +606,7 @@ class ValidatingModel(models.Model, metaclass=ModelBaseWithValidators):
         if queryset is None:
             queryset = cls.objects.all()
 
-        return queryset.filter(cls.get_custom_validity_condition()).exists()
+        return not queryset.exclude(cls.get_custom_validity_condition()).exists()
 
     def ensure_values_exist(
             self,
@@ -18,7 +18,9 @@ def collect_validation_errors(old_func: Callable[..., Iterable[ValidationError]]
     def new_func(*args, **kwargs) -> None:
         errors = {}
         for error in old_func(*args, **kwargs):
-            ValidationError(error).update_error_dict(errors)
+            if not isinstance(error, ValidationError):
+                error = ValidationError(error)
+            error.update_error_dict(errors)
         if errors:
             raise ValidationError(errors)
 
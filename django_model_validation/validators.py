@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
-from types import GeneratorType
-from typing import TYPE_CHECKING, Callable, Optional, Type
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Type
 
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db.models import Q, QuerySet
+from django.db import transaction
+from django.db.models import Q, QuerySet, prefetch_related_objects
 
 from django_model_validation.cache_field import ModelValidatorCacheField
 
@@ -11,11 +11,14 @@ if TYPE_CHECKING:
     from django_model_validation.models import ValidatingModel
 
 
+# Name of the instance attribute storing the results of validators with the `memoize` option
+VALIDATOR_MEMO_ATTRIBUTE = '_validator_memo'
+
+
 class ValidatorHasNoCacheError(Exception):
     pass
 
 
-@dataclass
 class ModelInstanceValidator:
     """
     Represents the enhanced validator method of a Django model for a specific model instance.
@@ -24,30 +27,14 @@ class ModelInstanceValidator:
         model_validator (ModelValidator): The associated `ModelValidator` containing the validator method.
         model_instance: The instance of the Django model being validated.
     """
-    model_validator: 'ModelValidator'
-    model_instance: 'ValidatingModel'
-
-    def _get_validation_error(self) -> Optional[ValidationError]:
-        try:
-            result = self.model_validator.method(self.model_instance)
-
-            if isinstance(result, bool):
-                if not result:
-                    return ValidationError(
-                        f"The validator \"{self.model_validator.get_property_verbose_name()}\" failed.",
-                    )
-                else:
-                    return None
-
-            if isinstance(result, GeneratorType):
-                result = list(result)
+    __slots__ = ('model_validator', 'model_instance')
 
-            if result:
-                return ValidationError(result)
-        except ValidationError as err:
-            return err
+    def __init__(self, model_validator: 'ModelValidator', model_instance: 'ValidatingModel'):
+        self.model_validator = model_validator
+        self.model_instance = model_instance
 
-        return None
+    def _get_validation_error(self) -> Optional[ValidationError]:
+        return self.model_validator._get_validation_error(self.model_instance)
 
     def get_validation_error(self, *, update_cache: bool = True) -> Optional[ValidationError]:
         """
@@ -66,7 +53,7 @@ class ModelInstanceValidator:
         if self.model_validator.cache and update_cache:
             setattr(
                 self.model_instance,
-                self.model_validator.get_property_name(),
+                self.model_validator._property_name,
                 validation_error is None,
             )
 
@@ -112,11 +99,7 @@ class ModelInstanceValidator:
                 if cache_value is not None:
                     return cache_value
 
-        try:
-            self.validate(update_cache=update_cache)
-            return True
-        except ValidationError:
-            return False
+        return self.get_validation_error(update_cache=update_cache) is None
 
     def is_cached(self) -> bool:
         """
@@ -140,10 +123,10 @@ class ModelInstanceValidator:
         Raises:
             ValidatorHasNoCacheError: if the validator has no cache.
         """
-        try:
-            return getattr(self.model_instance, self.model_validator.get_property_name())
-        except AttributeError as err:
-            raise ValidatorHasNoCacheError() from err
+        if not self.model_validator.cache:
+            raise ValidatorHasNoCacheError()
+
+        return getattr(self.model_instance, self.model_validator._property_name)
 
     def update_cache(self) -> None:
         """
@@ -152,11 +135,30 @@ class ModelInstanceValidator:
         Raises:
             ValidatorHasNoCacheError: if the validator has no cache.
         """
-        try:
-            return setattr(self.model_instance, self.model_validator.get_property_name(),
-                           self.is_valid(use_cache=False))
-        except AttributeError as err:
-            raise ValidatorHasNoCacheError() from err
+        if not self.model_validator.cache:
+            raise ValidatorHasNoCacheError()
+
+        setattr(self.model_instance, self.model_validator._property_name, self.is_valid(use_cache=False))
+
+    def update_cache_and_save(self) -> None:
+        """
+        Runs this validation on the modal instance, updates the cached result accordingly and saves only the cache
+        field to the database. If the model instance has not been saved to the database yet, it is saved entirely
+        instead.
+
+        Raises:
+            ValidatorHasNoCacheError: if the validator has no cache.
+        """
+        self.update_cache()
+
+        if self.model_instance._state.adding:
+            # Fields can only be saved selectively for objects that already exist in the database
+            self.model_instance.save(update_validator_caches=False)
+        else:
+            self.model_instance.save(
+                update_fields=[self.model_validator._property_name],
+                update_validator_caches=False,
+            )
 
     def clear_cache(self) -> None:
         """
@@ -165,10 +167,10 @@ class ModelInstanceValidator:
         Raises:
             ValidatorHasNoCacheError: if the validator has no cache.
         """
-        try:
-            return setattr(self.model_instance, self.model_validator.get_property_name(), None)
-        except AttributeError as err:
-            raise ValidatorHasNoCacheError() from err
+        if not self.model_validator.cache:
+            raise ValidatorHasNoCacheError()
+
+        setattr(self.model_instance, self.model_validator._property_name, None)
 
     def __call__(self, *args, **kwargs) -> None:
         self.validate(*args, **kwargs)
@@ -197,9 +199,25 @@ class ModelValidator:
     auto_update_cache: bool
     property_name: Optional[str]
     property_verbose_name: Optional[str]
+    fields: Optional[tuple[str, ...]] = None
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+    memoize: bool = False
 
     model_type: Type['ValidatingModel'] = field(init=False, default=None)
 
+    def __post_init__(self):
+        # The property name and the conditions derived from it never change, so they are only computed once
+        if self.property_name is None:
+            self._property_name = f'is_{self.name}_successful'
+        else:
+            self._property_name = self.property_name
+
+        self._is_valid_condition = Q(**{self._property_name: True})
+        self._is_invalid_condition = Q(**{self._property_name: False})
+        self._is_invalid_or_unknown_condition = ~self._is_valid_condition
+        self._is_cached_condition = Q(**{f'{self._property_name}__isnull': False})
+
     @property
     def name(self) -> str:
         return self.method.__name__
@@ -207,15 +225,49 @@ class ModelValidator:
     def get_instance_validator(self, obj: 'ValidatingModel') -> ModelInstanceValidator:
         return ModelInstanceValidator(self, obj)
 
+    def _get_validation_error(self, obj: 'ValidatingModel') -> Optional[ValidationError]:
+        if not self.memoize:
+            return self._run_validation(obj)
+
+        # The property name is unique per model, unlike the method name which validators may share
+        memo = obj.__dict__.setdefault(VALIDATOR_MEMO_ATTRIBUTE, {})
+        if self._property_name not in memo:
+            memo[self._property_name] = self._run_validation(obj)
+
+        return memo[self._property_name]
+
+    def _run_validation(self, obj: 'ValidatingModel') -> Optional[ValidationError]:
+        try:
+            result = self.method(obj)
+
+            if result is None:
+                return None
+
+            if isinstance(result, bool):
+                if not result:
+                    return ValidationError(
+                        f"The validator \"{self.get_property_verbose_name()}\" failed.",
+                    )
+                else:
+                    return None
+
+            # `ValidationError` only unpacks lists, so generators and other iterators have to be consumed first
+            if isinstance(result, Iterator):
+                result = list(result)
+
+            if result:
+                return ValidationError(result)
+        except ValidationError as err:
+            return err
+
+        return None
+
     def get_property_name(self) -> str:
         """
         Returns the custom name of the boolean validity property associated with the validator or constructs one from
         the method name if this validator has no custom property name.
         """
-        if self.property_name is None:
-            return f'is_{self.name}_successful'
-        else:
-            return self.property_name
+        return self._property_name
 
     def get_property_verbose_name(self) -> str:
         """
@@ -244,7 +296,7 @@ class ModelValidator:
         Returns a `Q` object for checking if objects are valid based on the cached result.
         """
         if self.cache:
-            return Q(**{self.get_property_name(): True})
+            return self._is_valid_condition
         else:
             raise ValidatorHasNoCacheError()
 
@@ -259,9 +311,9 @@ class ModelValidator:
         """
         if self.cache:
             if include_unknown_validity:
-                return ~Q(**{self.get_property_name(): True})
+                return self._is_invalid_or_unknown_condition
             else:
-                return Q(**{self.get_property_name(): False})
+                return self._is_invalid_condition
         else:
             raise ValidatorHasNoCacheError()
 
@@ -270,7 +322,7 @@ class ModelValidator:
         Returns a `Q` object for checking if the validator cache is non-empty.
         """
         if self.cache:
-            return Q(**{f'{self.get_property_name()}__isnull': False})
+            return self._is_cached_condition
         else:
             raise ValidatorHasNoCacheError()
 
@@ -316,13 +368,16 @@ class ModelValidator:
 
         return queryset.filter(self.get_is_invalid_condition(include_unknown_validity=include_unknown_validity))
 
-    def is_all_valid(self, queryset: Optional[QuerySet] = None) -> bool:
+    def is_all_valid(self, queryset: Optional[QuerySet] = None, *, assume_cached: bool = False) -> bool:
         """
         Checks whether all objects are valid according to the cached results of this validation method.
 
         Args:
             queryset (`QuerySet`, optional): If provided, this `QuerySet` will be used as the source of objects,
                 otherwise a `QuerySet` will be constructed by calling the `all()` method on the default manager.
+            assume_cached (`bool`, optional): If `True`, objects without cached validity are ignored, which allows for
+                a simpler query. Otherwise, they are considered invalid.
+                *Defaults to False.*
 
         Returns:
             `True` if all objects are valid, `False` if at least one object is not valid.
@@ -330,7 +385,7 @@ class ModelValidator:
         if queryset is None:
             queryset = self.model_type.objects.all()
 
-        return self.get_invalid_objects(queryset).exists()
+        return not self.get_invalid_objects(queryset, include_unknown_validity=not assume_cached).exists()
 
     def is_all_cached(self, queryset: Optional[QuerySet] = None) -> bool:
         """
@@ -348,14 +403,19 @@ class ModelValidator:
 
         return not queryset.filter(~self.get_is_cached_condition()).exists()
 
-    def update_cache(self, queryset: Optional[QuerySet] = None) -> None:
+    def update_cache(self, queryset: Optional[QuerySet] = None, *, batch_size: int = 1000) -> None:
         """
         Runs the validation on all objects in the database (or a subset thereof) and updates the cached results
         accordingly.
 
+        The objects are fetched and written back in batches, such that only the cache field is updated using a single
+        query per batch.
+
         Args:
             queryset (`QuerySet`, optional): If provided, this `QuerySet` will be used as the source of objects,
                 otherwise a `QuerySet` will be constructed by calling the `all()` method on the default manager.
+            batch_size (int, optional): The number of objects fetched and updated per query.
+                *Defaults to 1000.*
         """
         if not self.cache:
             raise ValidatorHasNoCacheError()
@@ -363,9 +423,7 @@ class ModelValidator:
         if queryset is None:
             queryset = self.model_type.objects.all()
 
-        for obj in queryset:
-            self.get_instance_validator(obj).update_cache()
-            obj.save(update_validator_caches=False)
+        update_caches(queryset, [self], batch_size=batch_size)
 
     def clear_cache(self, queryset: Optional[QuerySet] = None) -> None:
         """
@@ -391,3 +449,85 @@ class ModelValidator:
             return self
         else:
             return self.get_instance_validator(instance)
+
+
+def update_caches(queryset: QuerySet, model_validators: Iterable[ModelValidator], *, batch_size: int = 1000) -> None:
+    """
+    Runs the given validators on all objects of a `QuerySet` and updates their cached results.
+
+    The objects are fetched in batches and each batch is written back using a single query that updates the cache
+    fields of all given validators at once. Relations declared by the validators using `select_related` and
+    `prefetch_related` are loaded along with each batch. If the `QuerySet` has already been evaluated, its objects are
+    used without fetching them again.
+
+    Args:
+        queryset (`QuerySet`): The source of objects.
+        model_validators: The validators whose caches should be updated. All of them must have a cache.
+        batch_size (int, optional): The number of objects fetched and updated per query.
+            *Defaults to 1000.*
+
+    Raises:
+        ValidatorHasNoCacheError: if any of the validators has no cache.
+    """
+    model_validators = list(model_validators)
+
+    if not all(model_validator.cache for model_validator in model_validators):
+        raise ValidatorHasNoCacheError()
+
+    if not model_validators:
+        return
+
+    field_names = [model_validator.get_property_name() for model_validator in model_validators]
+    manager = queryset.model._base_manager.db_manager(queryset.db)
+
+    select_related = list(dict.fromkeys(
+        lookup for model_validator in model_validators for lookup in model_validator.select_related
+    ))
+    prefetch_related = list(dict.fromkeys(
+        lookup for model_validator in model_validators for lookup in model_validator.prefetch_related
+    ))
+
+    if queryset._result_cache is not None:
+        # Joining relations would require fetching the objects again, so all relations are prefetched instead
+        objects = queryset._result_cache
+        prefetch_related = list(dict.fromkeys([*select_related, *prefetch_related]))
+    else:
+        # A `QuerySet` that already joins all relations must not be restricted to the declared ones
+        if select_related and queryset.query.select_related is not True:
+            queryset = queryset.select_related(*select_related)
+
+        # Restricting the loaded fields is only safe if every validator declares the fields it accesses. All joined
+        # relations, including those of the given `QuerySet`, must be loaded as well. Only their first segments are
+        # passed, since nested paths would defer all fields of intermediate models.
+        joined_relations = queryset.query.select_related
+        if joined_relations is not True and all(
+                model_validator.fields is not None for model_validator in model_validators
+        ):
+            queryset = queryset.only(*field_names, *(joined_relations or ()), *(
+                field_name for model_validator in model_validators for field_name in model_validator.fields
+            ))
+
+        objects = queryset.iterator(chunk_size=batch_size)
+
+    def update_batch(batch):
+        # Prefetching is done per batch, since `QuerySet.iterator()` does not prefetch in all supported Django versions
+        if prefetch_related:
+            prefetch_related_objects(batch, *prefetch_related)
+
+        for obj in batch:
+            for model_validator, field_name in zip(model_validators, field_names):
+                setattr(obj, field_name, model_validator._get_validation_error(obj) is None)
+
+        manager.bulk_update(batch, field_names)
+
+    with transaction.atomic(using=queryset.db):
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+
+            if len(batch) >= batch_size:
+                update_batch(batch)
+                batch = []
+
+        if batch:
+            update_batch(batch)
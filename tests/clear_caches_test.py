@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from django.db import connection, models
+
+from django_model_validation.models import ValidatingModel, validator
+
+
+class Note(ValidatingModel):
+    text = models.CharField(max_length=30, blank=True)
+
+    @validator(cache=True, property_name='has_text')
+    def validate_text(self):
+        return bool(self.text)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class ClearCachesTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(Note)
+
+        for text in ['a', '', 'b', '']:
+            Note(text=text).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Note)
+
+    def setUp(self):
+        Note.update_validator_caches_globally()
+
+    def test_clear_caches_in_chunks(self):
+        Note.clear_validator_caches_globally(chunk_size=3)
+
+        self.assertFalse(Note.objects.filter(has_text__isnull=False).exists())
+
+    def test_clear_caches_rejects_non_positive_chunk_size(self):
+        for chunk_size in [0, -1]:
+            with self.assertRaises(ValueError):
+                Note.clear_validator_caches_globally(chunk_size=chunk_size)
+
+        self.assertFalse(Note.objects.filter(has_text__isnull=True).exists())
@@ -0,0 +1,11 @@
+import django
+from django.conf import settings
+
+
+def pytest_configure():
+    settings.configure(
+        INSTALLED_APPS=['django_model_validation', 'tests'],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+from django.db import connection, models
+
+from django_model_validation.models import ValidatingModel, validator
+
+
+class AbstractNamed(ValidatingModel):
+    name = models.CharField(max_length=30, blank=True)
+
+    @validator(cache=True, property_name='is_named')
+    def validate_named(self):
+        return bool(self.name)
+
+    class Meta:
+        abstract = True
+        app_label = 'tests'
+
+
+class Named(AbstractNamed):
+
+    class Meta:
+        app_label = 'tests'
+
+
+class Place(ValidatingModel):
+    name = models.CharField(max_length=30, blank=True)
+
+    @validator(cache=True, property_name='is_named')
+    def validate_named(self):
+        return bool(self.name)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class Restaurant(Place):
+
+    class Meta:
+        app_label = 'tests'
+
+
+class InheritanceTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(Named)
+            schema_editor.create_model(Place)
+            schema_editor.create_model(Restaurant)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Restaurant)
+            schema_editor.delete_model(Place)
+            schema_editor.delete_model(Named)
+
+    def test_validators_are_inherited(self):
+        self.assertEqual([v.name for v in Named._model_validators], ['validate_named'])
+        self.assertEqual([v.name for v in Restaurant._model_validators], ['validate_named'])
+        self.assertFalse(Named(name='').is_valid())
+        self.assertFalse(Restaurant(name='').is_valid())
+
+    def test_inherited_validators_are_bound_to_subclass(self):
+        self.assertIs(Named.validate_named.model_type, Named)
+        self.assertIs(Restaurant.validate_named.model_type, Restaurant)
+        self.assertIs(Place.validate_named.model_type, Place)
+
+    def test_class_level_helpers_on_subclass_of_abstract_model(self):
+        Named(name='Name').save(update_validator_caches=False)
+
+        Named.validate_named.update_cache()
+
+        self.assertTrue(Named.validate_named.is_all_valid())
+        self.assertEqual(Named.validate_named.get_valid_objects().count(), 1)
+
+    def test_class_level_helpers_on_subclass_of_concrete_model(self):
+        Place(name='').save()
+        Restaurant(name='Name').save(update_validator_caches=False)
+
+        Restaurant.validate_named.update_cache()
+
+        self.assertTrue(Restaurant.validate_named.is_all_valid())
+        self.assertFalse(Place.validate_named.is_all_valid())
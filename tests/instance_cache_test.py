@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from django.db import connection, models
+
+from django_model_validation.models import ValidatingModel, validator
+
+
+class Article(ValidatingModel):
+    title = models.CharField(max_length=30, blank=True)
+
+    @validator(cache=True, property_name='has_title')
+    def validate_title(self):
+        return bool(self.title)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class InstanceCacheTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(Article)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Article)
+
+    def test_update_cache_and_save_saves_only_cache_field(self):
+        article = Article(title='Title')
+        article.save(update_validator_caches=False)
+        article.title = ''
+
+        article.validate_title.update_cache_and_save()
+
+        article.refresh_from_db()
+        self.assertEqual(article.title, 'Title')
+        self.assertFalse(article.has_title)
+
+    def test_update_cache_and_save_saves_new_instance(self):
+        article = Article(title='Title')
+
+        article.validate_title.update_cache_and_save()
+
+        self.assertIsNotNone(article.pk)
+        self.assertTrue(Article.objects.get(pk=article.pk).has_title)
+
+    def test_update_validator_caches_saves_new_instance(self):
+        article = Article(title='')
+
+        article.update_validator_caches(save=True)
+
+        self.assertIsNotNone(article.pk)
+        self.assertFalse(Article.objects.get(pk=article.pk).has_title)
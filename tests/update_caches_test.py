@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from django.db import connection, models
+
+from django_model_validation.models import ValidatingModel, validator
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=30)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class Book(ValidatingModel):
+    title = models.CharField(max_length=30, blank=True)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+
+    @validator(cache=True, property_name='has_title', fields=['title'])
+    def validate_title(self):
+        return bool(self.title)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class UpdateCachesTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(Author)
+            schema_editor.create_model(Book)
+
+        author = Author.objects.create(name='Author')
+        Book(title='Title', author=author).save(update_validator_caches=False)
+        Book(title='', author=author).save(update_validator_caches=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Book)
+            schema_editor.delete_model(Author)
+
+    def setUp(self):
+        Book.objects.update(has_title=None)
+
+    def test_update_cache(self):
+        Book.validate_title.update_cache()
+
+        self.assertEqual(list(Book.objects.order_by('pk').values_list('has_title', flat=True)), [True, False])
+
+    def test_update_cache_with_select_related_queryset(self):
+        Book.validate_title.update_cache(Book.objects.select_related('author'))
+
+        self.assertEqual(list(Book.objects.order_by('pk').values_list('has_title', flat=True)), [True, False])
+
+    def test_update_cache_with_select_all_related_queryset(self):
+        Book.validate_title.update_cache(Book.objects.select_related())
+
+        self.assertEqual(list(Book.objects.order_by('pk').values_list('has_title', flat=True)), [True, False])